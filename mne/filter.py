@@ -2,7 +2,7 @@
 
 from collections import Counter
 from copy import deepcopy
-from functools import partial
+from functools import partial, lru_cache
 
 import numpy as np
 
@@ -10,7 +10,8 @@ from .annotations import _annotations_starts_stops
 from .fixes import _import_fft
 from .io.pick import _picks_to_idx
 from .cuda import (_setup_cuda_fft_multiply_repeated, _fft_multiply_repeated,
-                   _setup_cuda_fft_resample, _fft_resample, _smart_pad)
+                   _setup_cuda_fft_resample, _fft_resample, _smart_pad,
+                   _cuda_upload_rfft)
 from .parallel import parallel_func, check_n_jobs
 from .time_frequency.multitaper import _mt_spectra, _compute_mt_params
 from .utils import (logger, verbose, sum_squared, warn, _pl,
@@ -200,15 +201,21 @@ def _overlap_add_filter(x, h, n_fft=None, phase='zero', picks=None,
     # Figure out if we should use CUDA
     n_jobs, cuda_dict = _setup_cuda_fft_multiply_repeated(
         n_jobs, h, n_fft)
+    use_cuda = cuda_dict['rfft'] is _cuda_upload_rfft
 
-    # Process each row separately
+    # Process blocks of rows at once, or each row separately for CUDA
     picks = _picks_to_idx(len(x), picks)
     if n_jobs == 1:
-        for p in picks:
-            x[p] = _1d_overlap_filter(x[p], len(h), n_edge, phase,
-                                      cuda_dict, pad, n_fft)
+        if use_cuda:
+            blocks = picks
+        else:
+            blocks = _block_picks(picks, n_x)
+        for block in blocks:
+            x[block] = _1d_overlap_filter(x[block], len(h), n_edge, phase,
+                                          cuda_dict, pad, n_fft)
     else:
-        parallel, p_fun, _ = parallel_func(_1d_overlap_filter, n_jobs)
+        parallel, p_fun, _ = parallel_func(_1d_overlap_filter, n_jobs,
+                                           prefer='threads')
         data_new = parallel(p_fun(x[p], len(h), n_edge, phase,
                                   cuda_dict, pad, n_fft) for p in picks)
         for pp, p in enumerate(picks):
@@ -219,10 +226,10 @@ def _overlap_add_filter(x, h, n_fft=None, phase='zero', picks=None,
 
 
 def _1d_overlap_filter(x, n_h, n_edge, phase, cuda_dict, pad, n_fft):
-    """Do one-dimensional overlap-add FFT FIR filtering."""
+    """Do one-dimensional overlap-add FFT FIR filtering along the last axis."""
     # pad to reduce ringing
     x_ext = _smart_pad(x, (n_edge, n_edge), pad)
-    n_x = len(x_ext)
+    n_x = x_ext.shape[-1]
     x_filtered = np.zeros_like(x_ext)
 
     n_seg = n_fft - n_h + 1
@@ -234,8 +241,10 @@ def _1d_overlap_filter(x, n_h, n_edge, phase, cuda_dict, pad, n_fft):
     for seg_idx in range(n_segments):
         start = seg_idx * n_seg
         stop = (seg_idx + 1) * n_seg
-        seg = x_ext[start:stop]
-        seg = np.concatenate([seg, np.zeros(n_fft - len(seg))])
+        seg = x_ext[..., start:stop]
+        seg = np.concatenate(
+            [seg, np.zeros(seg.shape[:-1] + (n_fft - seg.shape[-1],))],
+            axis=-1)
 
         prod = _fft_multiply_repeated(seg, cuda_dict)
 
@@ -243,10 +252,11 @@ def _1d_overlap_filter(x, n_h, n_edge, phase, cuda_dict, pad, n_fft):
         stop_filt = min(start - shift + n_fft, n_x)
         start_prod = max(0, shift - start)
         stop_prod = start_prod + stop_filt - start_filt
-        x_filtered[start_filt:stop_filt] += prod[start_prod:stop_prod]
+        x_filtered[..., start_filt:stop_filt] += \
+            prod[..., start_prod:stop_prod]
 
     # Remove mirrored edges that we added and cast (n_edge can be zero)
-    x_filtered = x_filtered[:n_x - 2 * n_edge].astype(x.dtype)
+    x_filtered = x_filtered[..., :n_x - 2 * n_edge].astype(x.dtype)
     return x_filtered
 
 
@@ -262,6 +272,12 @@ def _filter_attenuation(h, freq, gain):
     return att_db, att_freq
 
 
+def _block_picks(picks, n_times, max_size=2 ** 22):
+    """Split picks into blocks of rows with about max_size samples each."""
+    n_rows = max(max_size // max(n_times, 1), 1)
+    return [picks[ii:ii + n_rows] for ii in range(0, len(picks), n_rows)]
+
+
 def _prep_for_filtering(x, copy, picks=None):
     """Set up array as 2D for filtering ease."""
     x = _check_filterable(x)
@@ -362,12 +378,7 @@ def _construct_fir_filter(sfreq, freq, gain, filter_length, phase, fir_window,
         Filter coefficients.
     """
     assert freq[0] == 0
-    if fir_design == 'firwin2':
-        from scipy.signal import firwin2 as fir_design
-    else:
-        assert fir_design == 'firwin'
-        fir_design = partial(_firwin_design, sfreq=sfreq)
-    from scipy.signal import minimum_phase
+    assert fir_design in ('firwin2', 'firwin')
 
     # issue a warning if attenuation is less than this
     min_att_db = 12 if phase == 'minimum' else 20
@@ -381,14 +392,9 @@ def _construct_fir_filter(sfreq, freq, gain, filter_length, phase, fir_window,
 
     # Use overlap-add filter with a fixed length
     N = _check_zero_phase_length(filter_length, phase, gain[-1])
-    # construct symmetric (linear phase) filter
-    if phase == 'minimum':
-        h = fir_design(N * 2 - 1, freq, gain, window=fir_window)
-        h = minimum_phase(h)
-    else:
-        h = fir_design(N, freq, gain, window=fir_window)
-    assert h.size == N
-    att_db, att_freq = _filter_attenuation(h, freq, gain)
+    h, att_db, att_freq = _design_fir_filter(
+        sfreq, tuple(freq), tuple(gain), N, phase, fir_window, fir_design)
+    h = h.copy()  # do not let callers modify the cached version
     if phase == 'zero-double':
         att_db += 6
     if att_db < min_att_db:
@@ -399,6 +405,26 @@ def _construct_fir_filter(sfreq, freq, gain, filter_length, phase, fir_window,
     return h
 
 
+@lru_cache(maxsize=32)
+def _design_fir_filter(sfreq, freq, gain, N, phase, fir_window, fir_design):
+    """Design a FIR filter and get its attenuation (cached)."""
+    if fir_design == 'firwin2':
+        from scipy.signal import firwin2 as fir_design
+    else:
+        fir_design = partial(_firwin_design, sfreq=sfreq)
+    from scipy.signal import minimum_phase
+    freq, gain = np.array(freq), np.array(gain)
+    # construct symmetric (linear phase) filter
+    if phase == 'minimum':
+        h = fir_design(N * 2 - 1, freq, gain, window=fir_window)
+        h = minimum_phase(h)
+    else:
+        h = fir_design(N, freq, gain, window=fir_window)
+    assert h.size == N
+    att_db, att_freq = _filter_attenuation(h, freq, gain)
+    return h, att_db, att_freq
+
+
 def _check_zero_phase_length(N, phase, gain_nyq=0):
     N = int(N)
     if N % 2 == 0:
@@ -440,10 +466,10 @@ def _filtfilt(x, iir_params, picks, n_jobs, copy):
                       padlen=padlen, axis=-1)
         _check_coefficients((iir_params['b'], iir_params['a']))
     if n_jobs == 1:
-        for p in picks:
-            x[p] = fun(x=x[p])
+        for block in _block_picks(picks, x.shape[1]):
+            x[block] = fun(x=x[block])
     else:
-        parallel, p_fun, _ = parallel_func(fun, n_jobs)
+        parallel, p_fun, _ = parallel_func(fun, n_jobs, prefer='threads')
         data_new = parallel(p_fun(x=x[p]) for p in picks)
         for pp, p in enumerate(picks):
             x[p] = data_new[pp]
@@ -2166,13 +2192,17 @@ class FilterMixin(object):
             self._data = self._data.astype(dtype)
 
         if n_jobs == 1:
-            # modify data inplace to save memory
-            for idx in picks:
-                self._data[..., idx, :] = _check_fun(
-                    _my_hilbert, data_in[..., idx, :], *args, **kwargs)
+            # modify data inplace to save memory, transforming blocks of
+            # channels with a single FFT call each
+            n_times = int(np.prod(data_in.shape[:-2])) * n_fft
+            for block in _block_picks(picks, n_times):
+                self._data[..., block, :] = _check_fun(
+                    _my_hilbert, data_in[..., block, :], *args, **kwargs)
         else:
-            # use parallel function
-            parallel, p_fun, _ = parallel_func(_check_fun, n_jobs)
+            # use parallel function, threads suffice as the FFTs release
+            # the GIL and this avoids pickling the data
+            parallel, p_fun, _ = parallel_func(_check_fun, n_jobs,
+                                               prefer='threads')
             data_picks_new = parallel(
                 p_fun(_my_hilbert, data_in[..., p, :], *args, **kwargs)
                 for p in picks)
@@ -2214,12 +2244,31 @@ def _my_hilbert(x, n_fft=None, envelope=False):
     """
     from scipy.signal import hilbert
     n_x = x.shape[-1]
-    out = hilbert(x, N=n_fft, axis=-1)[..., :n_x]
     if envelope:
-        out = np.abs(out)
+        # only the imaginary part of the analytic signal (the Hilbert
+        # transform proper) is needed, which real FFTs can compute
+        out = _hilbert_imag(x, n_fft)
+        out *= out
+        out += x * x
+        out = np.sqrt(out, out=out)
+    else:
+        out = hilbert(x, N=n_fft, axis=-1)[..., :n_x]
     return out
 
 
+def _hilbert_imag(x, n_fft=None):
+    """Compute the Hilbert transform of real signals using real FFTs."""
+    rfft, irfft = _import_fft(('rfft', 'irfft'))
+    n_x = x.shape[-1]
+    n_fft = n_x if n_fft is None else n_fft
+    x_fft = rfft(x, n_fft, axis=-1)
+    x_fft *= -1j  # shift positive frequencies by -pi/2
+    x_fft[..., 0] = 0.
+    if n_fft % 2 == 0:
+        x_fft[..., -1] = 0.
+    return irfft(x_fft, n_fft, axis=-1)[..., :n_x]
+
+
 @verbose
 def design_mne_c_filter(sfreq, l_freq=None, h_freq=40.,
                         l_trans_bandwidth=None, h_trans_bandwidth=5.,
@@ -2301,10 +2350,14 @@ def _filt_check_picks(info, picks, h_freq, l_freq):
     from .io.pick import _picks_to_idx
     update_info = False
     # This will pick *all* data channels
+    all_data = picks is None
     picks = _picks_to_idx(info, picks, 'data_or_ica', exclude=())
     if h_freq is not None or l_freq is not None:
-        data_picks = _picks_to_idx(info, None, 'data_or_ica', exclude=(),
-                                   allow_empty=True)
+        if all_data:  # no need to pick them again
+            data_picks = picks
+        else:
+            data_picks = _picks_to_idx(info, None, 'data_or_ica', exclude=(),
+                                       allow_empty=True)
         if len(data_picks) == 0:
             logger.info('No data channels found. The highpass and '
                         'lowpass values in the measurement info will not '
@@ -10,6 +10,8 @@
 #
 # License: BSD (3-clause)
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from copy import deepcopy
 from datetime import timedelta
 import os
@@ -20,10 +22,11 @@ from collections import defaultdict
 import numpy as np
 
 from .constants import FIFF
-from .utils import _construct_bids_filename, _check_orig_units
+from .utils import (_construct_bids_filename, _check_orig_units,
+                    _get_cals)
 from .pick import (pick_types, pick_channels, pick_info, _picks_to_idx,
                    channel_type)
-from .meas_info import write_meas_info
+from .meas_info import write_meas_info, Info
 from .proj import setup_proj, activate_proj, _proj_equal, ProjMixin
 from ..channels.channels import (ContainsMixin, UpdateChannelsMixin,
                                  SetChannelsMixin, InterpolationMixin,
@@ -185,9 +188,7 @@ class BaseRaw(ProjMixin, ContainsMixin, UpdateChannelsMixin, SetChannelsMixin,
         info._check_consistency()  # make sure subclass did a good job
         self.info = info
         self.buffer_size_sec = float(buffer_size_sec)
-        cals = np.empty(info['nchan'])
-        for k in range(info['nchan']):
-            cals[k] = info['chs'][k]['range'] * info['chs'][k]['cal']
+        cals = _get_cals(info['chs'])
         bad = np.where(cals == 0)[0]
         if len(bad) > 0:
             raise ValueError('Bad cals for channels %s'
@@ -774,7 +775,13 @@ class BaseRaw(ProjMixin, ContainsMixin, UpdateChannelsMixin, SetChannelsMixin,
     def _getitem(self, item, return_times=True):
         sel, start, stop = self._parse_get_set_params(item)
         if self.preload:
-            data = self._data[sel, start:stop]
+            idx = _convert_slice(sel)
+            if isinstance(idx, slice):
+                # contiguous channels: copy a view rather than fancy index
+                # (np.array also turns memmap-preloaded data into ndarray)
+                data = np.array(self._data[idx, start:stop])
+            else:
+                data = self._data[sel, start:stop]
         else:
             data = self._read_segment(start=start, stop=stop, sel=sel,
                                       projector=self._projector)
@@ -2039,10 +2046,8 @@ def _write_raw_fid(raw, info, picks, fid, cals, part_idx, start, stop,
 
     # Check to see if this has acquisition skips and, if so, if we can
     # write out empty buffers instead of zeroes
-    firsts = list(range(start, stop, buffer_size))
-    lasts = np.array(firsts) + buffer_size
-    if lasts[-1] > stop:
-        lasts[-1] = stop
+    firsts = np.arange(start, stop, buffer_size)
+    lasts = np.minimum(firsts + buffer_size, stop)
     sk_onsets, sk_ends = _annotations_starts_stops(raw, 'bad_acq_skip')
     do_skips = False
     if len(sk_onsets) > 0:
@@ -2052,71 +2057,81 @@ def _write_raw_fid(raw, info, picks, fid, cals, part_idx, start, stop,
             if part_idx == 0:
                 warn('Acquisition skips detected but did not fit evenly into '
                      'output buffer_size, will be written as zeroes.')
-
+    if do_skips:
+        is_skip = ((firsts[:, np.newaxis] >= sk_onsets) &
+                   (lasts[:, np.newaxis] <= sk_ends)).any(axis=1)
+    else:
+        is_skip = np.zeros(len(firsts), bool)
+    # use plain ints in the loop below
+    firsts, lasts, is_skip = firsts.tolist(), lasts.tolist(), is_skip.tolist()
+    bounds = [(first, last) for first, last, skip in
+              zip(firsts, lasts, is_skip) if not skip]
     n_current_skip = 0
     final_fname = use_fname
-    for first, last in zip(firsts, lasts):
-        if do_skips:
-            if ((first >= sk_onsets) & (last <= sk_ends)).any():
-                # Track how many we have
-                n_current_skip += 1
-                continue
-            elif n_current_skip > 0:
-                # Write out an empty buffer instead of data
-                write_int(fid, FIFF.FIFF_DATA_SKIP, n_current_skip)
-                # These two NOPs appear to be optional (MaxFilter does not do
-                # it, but some acquisition machines do) so let's not bother.
-                # write_nop(fid)
-                # write_nop(fid)
-                n_current_skip = 0
-        data, times = raw[picks, first:last]
-        assert len(times) == last - first
-
-        if projector is not None:
-            data = np.dot(projector, data)
-
-        if ((drop_small_buffer and (first > start) and
-             (len(times) < buffer_size))):
-            logger.info('Skipping data chunk due to small buffer ... '
-                        '[done]')
-            break
-        logger.debug('Writing ...')
-        _write_raw_buffer(fid, data, cals, fmt)
-
-        pos = fid.tell()
-        this_buff_size_bytes = pos - pos_prev
-        overage = pos - split_size + _NEXT_FILE_BUFFER
-        if overage > 0:
-            # This should occur on the first buffer write of the file, so
-            # we should mention the space required for the meas info
-            raise ValueError(
-                'buffer size (%s) is too large for the given split size (%s) '
-                'by %s bytes after writing info (%s) and leaving enough space '
-                'for end tags (%s): decrease "buffer_size_sec" or increase '
-                '"split_size".' % (this_buff_size_bytes, split_size, overage,
-                                   pos_prev, _NEXT_FILE_BUFFER))
-
-        # Split files if necessary, leave some space for next file info
-        # make sure we check to make sure we actually *need* another buffer
-        # with the "and" check
-        if pos >= split_size - this_buff_size_bytes - _NEXT_FILE_BUFFER and \
-                first + buffer_size < stop:
-            final_fname = reserved_fname
-            next_fname, next_idx = _write_raw(
-                fname, raw, info, picks, fmt,
-                data_type, reset_range, first + buffer_size, stop, buffer_size,
-                projector, drop_small_buffer, split_size, split_naming,
-                part_idx + 1, final_fname, overwrite)
-
-            start_block(fid, FIFF.FIFFB_REF)
-            write_int(fid, FIFF.FIFF_REF_ROLE, FIFF.FIFFV_ROLE_NEXT_FILE)
-            write_string(fid, FIFF.FIFF_REF_FILE_NAME, op.basename(next_fname))
-            if info['meas_id'] is not None:
-                write_id(fid, FIFF.FIFF_REF_FILE_ID, info['meas_id'])
-            write_int(fid, FIFF.FIFF_REF_FILE_NUM, next_idx)
-            end_block(fid, FIFF.FIFFB_REF)
-            break
-        pos_prev = pos
+    # make sure a prefetch in flight is finished even if writing fails
+    with closing(_iter_raw_buffers(raw, picks, projector, bounds)) as buffers:
+        for first, last, skip in zip(firsts, lasts, is_skip):
+            if do_skips:
+                if skip:
+                    # Track how many we have
+                    n_current_skip += 1
+                    continue
+                elif n_current_skip > 0:
+                    # Write out an empty buffer instead of data
+                    write_int(fid, FIFF.FIFF_DATA_SKIP, n_current_skip)
+                    # These two NOPs appear to be optional (MaxFilter does
+                    # not do it, but some acquisition machines do) so let's
+                    # not bother.
+                    # write_nop(fid)
+                    # write_nop(fid)
+                    n_current_skip = 0
+            data, times = next(buffers)
+            assert len(times) == last - first
+
+            if ((drop_small_buffer and (first > start) and
+                 (len(times) < buffer_size))):
+                logger.info('Skipping data chunk due to small buffer ... '
+                            '[done]')
+                break
+            logger.debug('Writing ...')
+            _write_raw_buffer(fid, data, cals, fmt)
+
+            pos = fid.tell()
+            this_buff_size_bytes = pos - pos_prev
+            overage = pos - split_size + _NEXT_FILE_BUFFER
+            if overage > 0:
+                # This should occur on the first buffer write of the file, so
+                # we should mention the space required for the meas info
+                raise ValueError(
+                    'buffer size (%s) is too large for the given split size '
+                    '(%s) by %s bytes after writing info (%s) and leaving '
+                    'enough space for end tags (%s): decrease '
+                    '"buffer_size_sec" or increase "split_size".'
+                    % (this_buff_size_bytes, split_size, overage, pos_prev,
+                       _NEXT_FILE_BUFFER))
+
+            # Split files if necessary, leave some space for next file info
+            # make sure we check to make sure we actually *need* another
+            # buffer with the "and" check
+            if pos >= split_size - this_buff_size_bytes - \
+                    _NEXT_FILE_BUFFER and first + buffer_size < stop:
+                final_fname = reserved_fname
+                next_fname, next_idx = _write_raw(
+                    fname, raw, info, picks, fmt,
+                    data_type, reset_range, first + buffer_size, stop,
+                    buffer_size, projector, drop_small_buffer, split_size,
+                    split_naming, part_idx + 1, final_fname, overwrite)
+
+                start_block(fid, FIFF.FIFFB_REF)
+                write_int(fid, FIFF.FIFF_REF_ROLE, FIFF.FIFFV_ROLE_NEXT_FILE)
+                write_string(fid, FIFF.FIFF_REF_FILE_NAME,
+                             op.basename(next_fname))
+                if info['meas_id'] is not None:
+                    write_id(fid, FIFF.FIFF_REF_FILE_ID, info['meas_id'])
+                write_int(fid, FIFF.FIFF_REF_FILE_NUM, next_idx)
+                end_block(fid, FIFF.FIFFB_REF)
+                break
+            pos_prev = pos
 
     logger.info('Closing %s' % use_fname)
     if info.get('maxshield', False):
@@ -2128,6 +2143,33 @@ def _write_raw_fid(raw, info, picks, fid, cals, part_idx, start, stop,
     return final_fname
 
 
+def _iter_raw_buffers(raw, picks, projector, bounds):
+    """Get the (projected) data buffers to write.
+
+    Unless the data are preloaded, the next buffer is read from disk in a
+    background thread while the current one is being written.
+    """
+    def _read(first, last):
+        data, times = raw[picks, first:last]
+        if projector is not None:
+            data = np.dot(projector, data)
+        return data, times
+
+    if raw.preload:
+        for first, last in bounds:
+            yield _read(first, last)
+        return
+    with ThreadPoolExecutor(1) as executor:
+        future = None
+        for bi, (first, last) in enumerate(bounds):
+            if future is None:
+                future = executor.submit(_read, first, last)
+            this_future = future
+            future = executor.submit(_read, *bounds[bi + 1]) \
+                if bi + 1 < len(bounds) else None
+            yield this_future.result()
+
+
 def _start_writing_raw(name, info, sel, data_type,
                        reset_range, annotations):
     """Start write raw data in file.
@@ -2153,13 +2195,17 @@ def _start_writing_raw(name, info, sel, data_type,
     -------
     fid : file
         The file descriptor.
-    cals : list
+    cals : ndarray, shape (n_channels, 1)
         calibration factors.
     """
     #
     # Measurement info
     #
-    info = pick_info(info, sel)
+    # Only the channel entries are modified below, so copy those rather
+    # than deep-copying everything (dig, projs, hpi_results, ...)
+    info = Info(info)
+    info['chs'] = [ch.copy() for ch in info['chs']]
+    info = pick_info(info, sel, copy=False)
 
     #
     # Create the file and save the essentials
@@ -2171,7 +2217,6 @@ def _start_writing_raw(name, info, sel, data_type,
     if info['meas_id'] is not None:
         write_id(fid, FIFF.FIFF_PARENT_BLOCK_ID, info['meas_id'])
 
-    cals = []
     for k in range(info['nchan']):
         #
         #   Scan numbers may have been messed up
@@ -2179,7 +2224,7 @@ def _start_writing_raw(name, info, sel, data_type,
         info['chs'][k]['scanno'] = k + 1  # scanno starts at 1 in FIF format
         if reset_range is True:
             info['chs'][k]['range'] = 1.0
-        cals.append(info['chs'][k]['cal'] * info['chs'][k]['range'])
+    cals = _get_cals(info['chs'])[:, np.newaxis]
 
     write_meas_info(fid, info, data_type=data_type, reset_range=reset_range)
 
@@ -2209,7 +2254,7 @@ def _write_raw_buffer(fid, buf, cals, fmt):
         an open raw data file.
     buf : array
         The buffer to write.
-    cals : array
+    cals : ndarray, shape (n_channels, 1)
         Calibration factors.
     fmt : str
         'short', 'int', 'single', or 'double' for 16/32 bit int or 32/64 bit
@@ -2221,30 +2266,33 @@ def _write_raw_buffer(fid, buf, cals, fmt):
 
     _check_option('fmt', fmt, ['short', 'int', 'single', 'double'])
 
-    cast_int = False  # allow unsafe cast
     if np.isrealobj(buf):
         if fmt == 'short':
             write_function = write_dau_pack16
-            cast_int = True
+            dtype = np.int32  # allow unsafe cast
         elif fmt == 'int':
             write_function = write_int
-            cast_int = True
+            dtype = np.int32  # allow unsafe cast
         elif fmt == 'single':
             write_function = write_float
+            dtype = '>f4'
         else:
             write_function = write_double
+            dtype = np.float64
     else:
         if fmt == 'single':
             write_function = write_complex64
+            dtype = '>c8'
         elif fmt == 'double':
             write_function = write_complex128
+            dtype = np.complex128
         else:
             raise ValueError('only "single" and "double" supported for '
                              'writing complex data')
 
-    buf = buf / np.ravel(cals)[:, None]
-    if cast_int:
-        buf = buf.astype(np.int32)
+    # uncalibrate and convert to the output type in a single pass
+    buf = np.divide(buf, cals, out=np.empty(buf.shape, dtype),
+                    casting='unsafe')
     write_function(fid, FIFF.FIFF_DATA_BUFFER, buf)
 
 
@@ -16,10 +16,10 @@ from ..constants import FIFF
 from ..open import fiff_open, _fiff_get_fid, _get_next_fname
 from ..meas_info import read_meas_info
 from ..tree import dir_tree_find
-from ..tag import read_tag, read_tag_info
+from ..tag import read_tag
 from ..base import (BaseRaw, _RawShell, _check_raw_compatibility,
                     _check_maxshield)
-from ..utils import _mult_cal_one
+from ..utils import _mult_cal_one, _get_cals
 
 from ...annotations import Annotations, _read_annotations_fif
 
@@ -28,6 +28,57 @@ from ...utils import (check_fname, logger, verbose, warn, fill_doc, _file_like,
                       _on_missing)
 
 
+# On-disk dtype and original format of the supported data buffer types
+_BUFFER_TYPE_DTYPE = {
+    FIFF.FIFFT_DAU_PACK16: np.dtype('>i2'),
+    FIFF.FIFFT_SHORT: np.dtype('>i2'),
+    FIFF.FIFFT_FLOAT: np.dtype('>f4'),
+    FIFF.FIFFT_DOUBLE: np.dtype('>f8'),
+    FIFF.FIFFT_INT: np.dtype('>i4'),
+    FIFF.FIFFT_COMPLEX_FLOAT: np.dtype('>c8'),
+    FIFF.FIFFT_COMPLEX_DOUBLE: np.dtype('>c16'),
+}
+_BUFFER_TYPE_FORMAT = {
+    FIFF.FIFFT_DAU_PACK16: 'short',
+    FIFF.FIFFT_SHORT: 'short',
+    FIFF.FIFFT_FLOAT: 'single',
+    FIFF.FIFFT_DOUBLE: 'double',
+    FIFF.FIFFT_INT: 'int',
+    FIFF.FIFFT_COMPLEX_FLOAT: 'single',
+    FIFF.FIFFT_COMPLEX_DOUBLE: 'double',
+}
+# log2 of the sample size indexed by type code, for counting samples with
+# shifts (all sample sizes are powers of two)
+_BUFFER_SHIFT_LUT = np.zeros(max(_BUFFER_TYPE_DTYPE) + 1, int)
+for _type, _dtype in _BUFFER_TYPE_DTYPE.items():
+    _BUFFER_SHIFT_LUT[_type] = _dtype.itemsize.bit_length() - 1
+    assert 1 << _BUFFER_SHIFT_LUT[_type] == _dtype.itemsize
+del _type, _dtype
+
+
+def _mmap_rows(mmap, pos, shape, rlims):
+    """Get a view of rows of a data buffer tag from a memory-mapped file.
+
+    Returns None when the tag cannot be handled this way (e.g., empty or
+    truncated buffers), in which case ``read_tag`` should be used instead.
+    """
+    header = mmap[pos:pos + 16]
+    if len(header) < 16:
+        return None
+    _, type_, size, _ = np.frombuffer(header, '>i4')
+    dtype = _BUFFER_TYPE_DTYPE.get(int(type_))
+    if dtype is None:
+        return None
+    row_size = dtype.itemsize * shape[1]
+    if size != row_size * shape[0]:
+        return None
+    start = pos + 16 + rlims[0] * row_size
+    stop = pos + 16 + rlims[1] * row_size
+    if stop > len(mmap):
+        return None
+    return mmap[start:stop].view(dtype).reshape(-1, shape[1])
+
+
 @fill_doc
 class Raw(BaseRaw):
     """Raw data in FIF format.
@@ -204,104 +255,59 @@ class Raw(BaseRaw):
             raw.first_samp = first_samp
             raw.set_annotations(annotations)
 
-            #   Go through the remaining tags in the directory
-            raw_extras = list()
-            nskip = 0
-            orig_format = None
-
-            for k in range(first, nent):
-                ent = directory[k]
-                # There can be skips in the data (e.g., if the user unclicked)
-                # an re-clicked the button
-                if ent.kind == FIFF.FIFF_DATA_SKIP:
-                    tag = read_tag(fid, ent.pos)
-                    nskip = int(tag.data)
-                elif ent.kind == FIFF.FIFF_DATA_BUFFER:
-                    #   Figure out the number of samples in this buffer
-                    if ent.type == FIFF.FIFFT_DAU_PACK16:
-                        nsamp = ent.size // (2 * nchan)
-                    elif ent.type == FIFF.FIFFT_SHORT:
-                        nsamp = ent.size // (2 * nchan)
-                    elif ent.type == FIFF.FIFFT_FLOAT:
-                        nsamp = ent.size // (4 * nchan)
-                    elif ent.type == FIFF.FIFFT_DOUBLE:
-                        nsamp = ent.size // (8 * nchan)
-                    elif ent.type == FIFF.FIFFT_INT:
-                        nsamp = ent.size // (4 * nchan)
-                    elif ent.type == FIFF.FIFFT_COMPLEX_FLOAT:
-                        nsamp = ent.size // (8 * nchan)
-                    elif ent.type == FIFF.FIFFT_COMPLEX_DOUBLE:
-                        nsamp = ent.size // (16 * nchan)
-                    else:
-                        raise ValueError('Cannot handle data buffers of type '
-                                         '%d' % ent.type)
-                    if orig_format is None:
-                        if ent.type == FIFF.FIFFT_DAU_PACK16:
-                            orig_format = 'short'
-                        elif ent.type == FIFF.FIFFT_SHORT:
-                            orig_format = 'short'
-                        elif ent.type == FIFF.FIFFT_FLOAT:
-                            orig_format = 'single'
-                        elif ent.type == FIFF.FIFFT_DOUBLE:
-                            orig_format = 'double'
-                        elif ent.type == FIFF.FIFFT_INT:
-                            orig_format = 'int'
-                        elif ent.type == FIFF.FIFFT_COMPLEX_FLOAT:
-                            orig_format = 'single'
-                        elif ent.type == FIFF.FIFFT_COMPLEX_DOUBLE:
-                            orig_format = 'double'
-
-                    #  Do we have an initial skip pending?
-                    if first_skip > 0:
-                        first_samp += nsamp * first_skip
-                        raw.first_samp = first_samp
-                        first_skip = 0
-
-                    #  Do we have a skip pending?
-                    if nskip > 0:
-                        raw_extras.append(dict(
-                            ent=None, first=first_samp, nsamp=nskip * nsamp,
-                            last=first_samp + nskip * nsamp - 1))
-                        first_samp += nskip * nsamp
-                        nskip = 0
-
-                    #  Add a data buffer
-                    raw_extras.append(dict(ent=ent, first=first_samp,
-                                           last=first_samp + nsamp - 1,
-                                           nsamp=nsamp))
-                    first_samp += nsamp
+            #   Go through the remaining tags in the directory, using array
+            #   operations for the (typically many) data buffers
+            ents = directory[first:nent]
+            kinds = np.array([ent.kind for ent in ents], int)
+            buf_idx = np.where(kinds == FIFF.FIFF_DATA_BUFFER)[0]
+            bufs = [ents[k] for k in buf_idx]
+            types = np.array([ent.type for ent in bufs], int)
+            sizes = np.array([ent.size for ent in bufs], int)
+            bad = ~np.in1d(types, list(_BUFFER_TYPE_DTYPE))
+            if bad.any():
+                raise ValueError('Cannot handle data buffers of type '
+                                 '%d' % types[bad][0])
+            #   Figure out the number of samples in each buffer
+            nsamps = (sizes >> _BUFFER_SHIFT_LUT[types]) // nchan
+            orig_format = _BUFFER_TYPE_FORMAT[types[0]] if len(types) else None
+
+            #   There can be skips in the data (e.g., if the user unclicked)
+            #   an re-clicked the button, these apply to the next buffer
+            nskips = np.zeros(len(bufs), int)
+            for k in np.where(kinds == FIFF.FIFF_DATA_SKIP)[0]:
+                bi = np.searchsorted(buf_idx, k)
+                if bi < len(bufs):
+                    nskips[bi] = int(read_tag(fid, ents[k].pos).data)
+
+            #  Do we have an initial skip pending?
+            if first_skip > 0 and len(bufs):
+                first_samp += nsamps[0] * first_skip
+                raw.first_samp = first_samp
+
+            #  Interleave the skips (ent=None) and the data buffers
+            nsamps_skip = nskips * nsamps
+            has_skip = nsamps_skip > 0
+            buf_out = np.arange(len(bufs)) + np.cumsum(has_skip)
+            nsamp = np.zeros(len(bufs) + has_skip.sum(), int)
+            nsamp[buf_out] = nsamps
+            nsamp[buf_out[has_skip] - 1] = nsamps_skip[has_skip]
+            ent = np.full(len(nsamp), None, object)
+            ent[buf_out] = bufs
+            raw_extras = dict(ent=ent.tolist())
 
             next_fname = _get_next_fname(fid, fname_rep, tree)
 
-        # reformat raw_extras to be a dict of list/ndarray rather than
-        # list of dict (faster access)
-        raw_extras = {key: [r[key] for r in raw_extras]
-                      for key in raw_extras[0]}
-        for key in raw_extras:
-            if key != 'ent':  # dict or None
-                raw_extras[key] = np.array(raw_extras[key], int)
-        if not np.array_equal(raw_extras['last'][:-1],
-                              raw_extras['first'][1:] - 1):
-            raise RuntimeError('FIF file appears to be broken')
-        bounds = np.cumsum(np.concatenate(
-            [raw_extras['first'][:1], raw_extras['nsamp']]))
+        bounds = first_samp + np.concatenate([[0], np.cumsum(nsamp)])
         raw_extras['bounds'] = bounds
         assert len(raw_extras['bounds']) == len(raw_extras['ent']) + 1
         # store the original buffer size
-        buffer_size_sec = np.median(raw_extras['nsamp']) / info['sfreq']
-        del raw_extras['first']
-        del raw_extras['last']
-        del raw_extras['nsamp']
+        buffer_size_sec = np.median(nsamp) / info['sfreq']
 
-        raw.last_samp = first_samp - 1
+        raw.last_samp = bounds[-1] - 1
         raw.orig_format = orig_format
 
         #   Add the calibration factors
-        cals = np.zeros(info['nchan'])
-        for k in range(info['nchan']):
-            cals[k] = info['chs'][k]['range'] * info['chs'][k]['cal']
-
-        raw._cals = cals
+        raw._cals = _get_cals(info['chs'])
         raw._raw_extras = raw_extras
         logger.info('    Range : %d ... %d =  %9.3f ... %9.3f secs' % (
                     raw.first_samp, raw.last_samp,
@@ -320,21 +326,15 @@ class Raw(BaseRaw):
         """Get the dtype to use to store data from disk."""
         if self._dtype_ is not None:
             return self._dtype_
+        # the buffer types are known from the directory, no need to go back
+        # to the file
         dtype = None
-        for raw_extra, filename in zip(self._raw_extras, self._filenames):
+        for raw_extra in self._raw_extras:
             for ent in raw_extra['ent']:
                 if ent is not None:
-                    with _fiff_get_fid(filename) as fid:
-                        fid.seek(ent.pos, 0)
-                        tag = read_tag_info(fid)
-                        if tag is not None:
-                            if tag.type in (FIFF.FIFFT_COMPLEX_FLOAT,
-                                            FIFF.FIFFT_COMPLEX_DOUBLE):
-                                dtype = np.complex128
-                            else:
-                                dtype = np.float64
-                    if dtype is not None:
-                        break
+                    dtype = _BUFFER_TYPE_DTYPE[ent.type]
+                    dtype = np.complex128 if dtype.kind == 'c' else np.float64
+                    break
             if dtype is not None:
                 break
         if dtype is None:
@@ -345,13 +345,21 @@ class Raw(BaseRaw):
     def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
         """Read a segment of data from a file."""
         n_bad = 0
-        with _fiff_get_fid(self._filenames[fi]) as fid:
+        fname = self._filenames[fi]
+        # read directly from a memory map when possible (zero-copy)
+        mmap = None
+        if not _file_like(fname) and \
+                op.splitext(str(fname))[1].lower() != '.gz':
+            mmap = np.memmap(fname, dtype=np.uint8, mode='r')
+        with _fiff_get_fid(fname) as fid:
             bounds = self._raw_extras[fi]['bounds']
             ents = self._raw_extras[fi]['ent']
             nchan = self._raw_extras[fi]['orig_nchan']
-            use = (stop > bounds[:-1]) & (start < bounds[1:])
+            # buffers overlapping [start, stop)
+            e_start = max(np.searchsorted(bounds, start, 'right') - 1, 0)
+            e_stop = np.searchsorted(bounds, stop, 'left')
             offset = 0
-            for ei in np.where(use)[0]:
+            for ei in range(e_start, e_stop):
                 first = bounds[ei]
                 last = bounds[ei + 1]
                 nsamp = last - first
@@ -359,18 +367,26 @@ class Raw(BaseRaw):
                 first_pick = max(start - first, 0)
                 last_pick = min(nsamp, stop - first)
                 picksamp = last_pick - first_pick
-                # only read data if it exists
-                if ent is not None:
-                    one = read_tag(fid, ent.pos,
-                                   shape=(nsamp, nchan),
-                                   rlims=(first_pick, last_pick)).data
+                data_view = data[:, offset:(offset + picksamp)]
+                # only read data if it exists, otherwise zero-fill in place
+                if ent is None:
+                    data_view.fill(0)
+                else:
+                    one = None
+                    if mmap is not None:
+                        one = _mmap_rows(mmap, ent.pos, (nsamp, nchan),
+                                         (first_pick, last_pick))
+                    if one is None:
+                        one = read_tag(fid, ent.pos,
+                                       shape=(nsamp, nchan),
+                                       rlims=(first_pick, last_pick)).data
                     try:
                         one.shape = (picksamp, nchan)
                     except AttributeError:  # one is None
                         n_bad += picksamp
+                        data_view.fill(0)
                     else:
-                        _mult_cal_one(data[:, offset:(offset + picksamp)],
-                                      one.T, idx, cals, mult)
+                        _mult_cal_one(data_view, one.T, idx, cals, mult)
                 offset += picksamp
             if n_bad:
                 warn(f'FIF raw buffer could not be read, acquisition error '
@@ -1702,6 +1702,66 @@ def test_str_like():
     assert_allclose(raw_path._data, raw_str._data)
 
 
+@pytest.mark.parametrize('fmt', ('short', 'int', 'single', 'double'))
+def test_read_sources(fmt, tmpdir):
+    """Test that memory-mapped, gzipped and file-like reads agree."""
+    raw = read_raw_fif(test_fif_fname).crop(0, 2).load_data()
+    fname = str(tmpdir.join('test_raw.fif'))
+    raw.save(fname, fmt=fmt, buffer_size_sec=0.5)
+    raw.save(fname + '.gz', fmt=fmt, buffer_size_sec=0.5)
+    raw_mmap = read_raw_fif(fname)
+    raw_gz = read_raw_fif(fname + '.gz')
+    with open(fname, 'rb') as fid:
+        raw_fid = read_raw_fif(fid, preload=True)
+    assert raw_mmap.orig_format == fmt
+    want = raw_fid.get_data()
+    rtol = 1e-3 if fmt == 'short' else 1e-6
+    assert_allclose(want, raw.get_data(), rtol=rtol, atol=1e-20)
+    sl = slice(*raw.time_as_index([0.4, 1.3]))
+    for this_raw in (raw_mmap, raw_gz):
+        assert_array_equal(this_raw.get_data(), want)
+        assert_array_equal(this_raw[1:10, sl][0], want[1:10, sl])
+
+
+def test_save_error_cleanup(tmpdir, monkeypatch):
+    """Test that failing to save closes the buffer reader."""
+    closed = list()
+    iter_raw_buffers = base._iter_raw_buffers
+
+    def _iter_closed(*args):
+        try:
+            yield from iter_raw_buffers(*args)
+        finally:
+            closed.append(True)
+
+    monkeypatch.setattr(base, '_iter_raw_buffers', _iter_closed)
+    raw = read_raw_fif(test_fif_fname)
+    fname = str(tmpdir.join('test_raw.fif'))
+    try:
+        raw.save(fname, split_size='3MB', buffer_size_sec=10.)
+    except ValueError as exc:  # keep the traceback (and its frames) alive
+        assert 'too large for the given split' in str(exc)
+        assert closed == [True]
+    else:
+        raise AssertionError('ValueError not raised')
+
+
+def test_skip_zero_fill(tmpdir):
+    """Test that acquisition skips are zeroed in a reused buffer."""
+    info = create_info(3, 100., 'eeg')
+    raw = RawArray(np.random.RandomState(0).randn(3, 1000), info)
+    raw.set_annotations(Annotations([1., 3.], [1., 2.], 'bad_acq_skip'))
+    fname = str(tmpdir.join('test_raw.fif'))
+    raw.save(fname, buffer_size_sec=1.)
+    raw = read_raw_fif(fname)
+    assert sum(ent is None for ent in raw._raw_extras[0]['ent']) == 2
+    want = raw.get_data()
+    data = np.full((3, 1000), np.nan)
+    got = raw._read_segment(data_buffer=data)
+    assert_array_equal(got, want)
+    assert_array_equal(got[:, 100:200], 0.)
+
+
 @pytest.mark.parametrize('fname', [
     test_fif_fname,
     testing._pytest_param(fif_fname),
@@ -553,13 +553,14 @@ def pick_info(info, sel=(), copy=True, verbose=None):
             info['comps'] = []
     info['chs'] = [info['chs'][k] for k in sel]
     info._update_redundant()
-    info['bads'] = [ch for ch in info['bads'] if ch in info['ch_names']]
+    ch_names = set(info['ch_names'])
+    info['bads'] = [ch for ch in info['bads'] if ch in ch_names]
 
     if 'comps' in info:
         comps = deepcopy(info['comps'])
         for c in comps:
             row_idx = [k for k, n in enumerate(c['data']['row_names'])
-                       if n in info['ch_names']]
+                       if n in ch_names]
             row_names = [c['data']['row_names'][i] for i in row_idx]
             rowcals = c['rowcals'][row_idx]
             c['rowcals'] = rowcals
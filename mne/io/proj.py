@@ -118,7 +118,8 @@ class ProjMixin(object):
         Parameters
         ----------
         projs : list
-            List with projection vectors.
+            List with projection vectors. The vector arrays are shared with
+            the instance rather than copied, so do not modify them inplace.
         remove_existing : bool
             Remove the projection vectors currently in the file.
         %(verbose_meth)s
@@ -136,8 +137,10 @@ class ProjMixin(object):
             raise ValueError('Only projs can be added. You supplied '
                              'something else.')
 
-        # mark proj as inactive, as they have not been applied
-        projs = deactivate_proj(projs, copy=True, verbose=self.verbose)
+        # mark proj as inactive, as they have not been applied (the vectors
+        # are never modified inplace so only the dicts need to be copied)
+        projs = [Projection(p, data=p['data'].copy()) for p in projs]
+        projs = deactivate_proj(projs, copy=False, verbose=self.verbose)
         if remove_existing:
             # we cannot remove the proj if they are active
             if any(p['active'] for p in self.info['projs']):
@@ -202,8 +205,9 @@ class ProjMixin(object):
                         'Setting proj attribute to True.')
             return self
 
-        _projector, info = setup_proj(deepcopy(self.info), add_eeg_ref=False,
-                                      activate=True, verbose=self.verbose)
+        _projector, info, U = _setup_proj(
+            deepcopy(self.info), add_eeg_ref=False, activate=True,
+            verbose=self.verbose)
         # let's not raise a RuntimeError here, otherwise interactive plotting
         if _projector is None:  # won't be fun.
             logger.info('The projections don\'t apply to these data.'
@@ -212,7 +216,10 @@ class ProjMixin(object):
         self._projector, self.info = _projector, info
         if isinstance(self, (BaseRaw, Evoked)):
             if self.preload:
-                self._data = np.dot(self._projector, self._data)
+                # the projector is I - U U^T with thin U, so use the
+                # low-rank form rather than a dense n_chan x n_chan product
+                data = np.dot(U, np.dot(U.T, self._data))
+                self._data = np.subtract(self._data, data, out=data)
         else:  # BaseEpochs
             if self.preload:
                 for ii, e in enumerate(self._data):
@@ -829,13 +836,21 @@ def setup_proj(info, add_eeg_ref=True, activate=True, verbose=None):
     info : dict
         The modified measurement info (Warning: info is modified inplace).
     """
+    projector, info, _ = _setup_proj(info, add_eeg_ref, activate, verbose)
+    return projector, info
+
+
+@verbose
+def _setup_proj(info, add_eeg_ref=True, activate=True, verbose=None):
+    """Set up projection, also returning the orthogonal basis U."""
     # Add EEG ref reference proj if necessary
     if add_eeg_ref and _needs_eeg_average_ref_proj(info):
         eeg_proj = make_eeg_average_ref_proj(info, activate=activate)
         info['projs'].append(eeg_proj)
 
     # Create the projector
-    projector, nproj = make_projector_info(info)
+    projector, nproj, U = make_projector(info['projs'], info['ch_names'],
+                                         info['bads'])
     if nproj == 0:
         if verbose:
             logger.info('The projection vectors do not apply to these '
@@ -849,7 +864,7 @@ def setup_proj(info, add_eeg_ref=True, activate=True, verbose=None):
     if activate:
         info['projs'] = activate_proj(info['projs'], copy=False)
 
-    return projector, info
+    return projector, info, U
 
 
 def _uniquify_projs(projs, check_active=True, sort=True):
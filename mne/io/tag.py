@@ -380,7 +380,9 @@ def _read_old_pack(fid, tag, shape, rlims):
 
 def _read_dir_entry_struct(fid, tag, shape, rlims):
     """Read dir entry struct tag."""
-    return [_read_tag_header(fid) for _ in range(tag.size // 16 - 1)]
+    # read all entries at once rather than one header at a time
+    s = fid.read(16 * (tag.size // 16 - 1))
+    return [Tag(*ent) for ent in struct.iter_unpack('>iIii', s)]
 
 
 def _read_julian(fid, tag, shape, rlims):
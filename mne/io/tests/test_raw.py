@@ -467,6 +467,24 @@ def test_get_data_reject():
     assert np.isnan(data).sum() == 3072  # but NaNs are introduced instead
 
 
+def test_getitem_copy(tmpdir):
+    """Test that indexing preloaded data returns copies."""
+    data = np.random.RandomState(0).randn(5, 100)
+    raw = RawArray(data.copy(), create_info(5, 100., 'eeg'))
+    fname = str(tmpdir.join('test_raw.fif'))
+    raw.save(fname, fmt='double')
+    raw_mmap = read_raw_fif(fname, preload=str(tmpdir.join('raw.dat')))
+    assert isinstance(raw_mmap._data, np.memmap)
+    for this_raw in (raw, raw_mmap):
+        for picks in ([1, 2, 3], [3, 1], [0], slice(1, 4)):
+            got = this_raw[picks, 10:20][0]
+            assert type(got) is np.ndarray
+            assert_array_equal(got, data[picks, 10:20])
+            got[:] = 0.
+            assert_array_equal(this_raw.get_data(), data)
+        assert type(this_raw.get_data()) is np.ndarray
+
+
 def test_5839():
     """Test concatenating raw objects with annotations."""
     # Global Time 0         1         2         3         4
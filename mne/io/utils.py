@@ -74,21 +74,27 @@ def _find_channels(ch_names, ch_type='EOG'):
     return eog_idx
 
 
+def _get_cals(chs):
+    """Get the calibration factors (range * cal) of a list of channels."""
+    return np.fromiter((ch['range'] * ch['cal'] for ch in chs),
+                       np.float64, len(chs))
+
+
 def _mult_cal_one(data_view, one, idx, cals, mult):
     """Take a chunk of raw data, multiply by mult or cals, and store."""
-    one = np.asarray(one, dtype=data_view.dtype)
+    one = np.asarray(one)
     assert data_view.shape[1] == one.shape[1], (data_view.shape[1], one.shape[1])  # noqa: E501
     if mult is not None:
+        # select the needed rows before casting, not after
+        one = np.asarray(one[idx], dtype=data_view.dtype)
         mult.ndim == one.ndim == 2
-        data_view[:] = mult @ one[idx]
+        # write the product directly into the output, no temporary
+        np.matmul(mult, one, out=data_view)
     else:
         assert cals is not None
-        if isinstance(idx, slice):
-            data_view[:] = one[idx]
-        else:
-            # faster than doing one = one[idx]
-            np.take(one, idx, axis=0, out=data_view)
-        data_view *= cals
+        # select the rows in the stored dtype, then cast and calibrate in
+        # a single pass (a view is used when idx is a slice)
+        np.multiply(one[idx], cals, out=data_view, casting='unsafe')
 
 
 def _blk_read_lims(start, stop, buf_len):
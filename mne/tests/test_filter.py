@@ -142,6 +142,24 @@ def test_1d_filter():
                             assert_allclose(x_filtered, x_expected, atol=1e-13)
 
 
+@pytest.mark.parametrize('pad', ('reflect_limited', 'reflect', 'edge'))
+def test_overlap_add_2d(pad):
+    """Test that multichannel overlap-add matches single-channel filtering."""
+    rng = np.random.RandomState(0)
+    h = rng.randn(21)
+    for n_times in (5, 100):
+        x = rng.randn(4, n_times)
+        for n_pad in ((0, 0), (3, 7), (30, 30)):
+            assert_array_equal(_smart_pad(x, n_pad, pad),
+                               [_smart_pad(row, n_pad, pad) for row in x])
+        want = [_overlap_add_filter(row[np.newaxis], h, pad=pad)[0]
+                for row in x]
+        assert_allclose(_overlap_add_filter(x, h, pad=pad), want, atol=1e-13)
+        # falls back to the CPU (and batching) when CUDA is not available
+        assert_allclose(_overlap_add_filter(x, h, pad=pad, n_jobs='cuda'),
+                        want, atol=1e-13)
+
+
 def test_iir_stability():
     """Test IIR filter stability check."""
     sig = np.random.RandomState(0).rand(1000)
@@ -762,4 +780,35 @@ def test_filter_picks():
                 assert_allclose(raw.get_data(), want)
 
 
+def test_fir_design_cache():
+    """Test that cached FIR designs are not shared and still warn."""
+    kwargs = dict(data=None, sfreq=1000., l_freq=None, h_freq=40.,
+                  fir_design='firwin')
+    h = create_filter(**kwargs)
+    h[:] = 0.
+    h_2 = create_filter(**kwargs)
+    assert h_2.any()
+    assert_array_equal(h_2, create_filter(**kwargs))
+    kwargs.update(filter_length=11, fir_design='firwin2')
+    for _ in range(2):
+        with pytest.warns(RuntimeWarning, match='Attenuation'):
+            create_filter(**kwargs)
+
+
+def test_hilbert_envelope():
+    """Test Hilbert envelope computation."""
+    from scipy.signal import hilbert
+    data = np.random.RandomState(0).randn(3, 1000)
+    info = create_info(3, 1000., 'eeg')
+    for n_jobs in (1, 2):
+        raw = RawArray(data.copy(), info)
+        raw.apply_hilbert(envelope=True, n_jobs=n_jobs)
+        assert raw.get_data().dtype == np.float64
+        assert_allclose(raw.get_data(), np.abs(hilbert(data, axis=-1)))
+    raw = RawArray(data.copy(), info)
+    raw.apply_hilbert(envelope=True, n_fft=2048)
+    assert_allclose(raw.get_data(),
+                    np.abs(hilbert(data, N=2048, axis=-1)[:, :1000]))
+
+
 run_tests_if_main()
@@ -349,6 +349,21 @@ def test_make_eeg_average_ref_proj():
     assert not _has_eeg_average_ref_proj(raw.info['projs'])
 
 
+def test_apply_proj_dense_equiv():
+    """Test that applying projectors matches the dense projector."""
+    raw = read_raw_fif(raw_fname, preload=True)
+    raw.set_eeg_reference(projection=True)
+    assert len(raw.info['projs']) > 1
+    proj, nproj, U = make_projector(raw.info['projs'], raw.ch_names,
+                                    raw.info['bads'])
+    assert nproj == U.shape[1] > 1
+    want = np.dot(proj, raw._data)
+    data_orig = raw._data
+    raw.apply_proj()
+    assert raw._data is not data_orig
+    assert_allclose(raw._data, want, atol=1e-20)
+
+
 def test_has_eeg_average_ref_proj():
     """Test checking whether an EEG average reference exists."""
     assert not _has_eeg_average_ref_proj([])